@@ -1,58 +1,267 @@
 #!/usr/bin/env node
 
 const { program } = require('commander');
-const { execSync, spawn } = require('child_process');
+const { execFile, execFileSync } = require('child_process');
 const fs = require('fs');
 const path = require('path');
 const os = require('os');
 
+const { version: CLI_VERSION } = require('../package.json');
+
 const BAYANAT_REPO_URL = 'https://github.com/sjacorg/bayanat.git';
+const DATABASE_URL = 'postgresql://bayanat@localhost/bayanat';
+const REDIS_URL = 'redis://localhost:6379/0';
+
+// Connection settings written into every generated .env
+const CONNECTION_CONFIG = `# Database (convention-based)
+DATABASE_URL=${DATABASE_URL}
+
+# Redis
+REDIS_URL=${REDIS_URL}
+`;
+
+// `version` key inside the [project] table, stopping at the next table header
+const PROJECT_VERSION_RE = /^\[project\][ \t]*$(?:(?!^\[)[\s\S])*?^version\s*=\s*["']([^"']+)["']/m;
+
+// Written into the venv after a successful pip install
+const REQUIREMENTS_STAMP = '.requirements.sha256';
+
+// Entries every Bayanat app directory must contain: [name, isDirectory]
+const REQUIRED_PATHS = [
+  ['run.py', false]
+];
+
+// Entries only the CLI's dependency step relies on
+const DEPENDENCY_PATHS = [
+  ['requirements', true],
+  ['env', true]
+];
 
 // Helper functions
+const commandCache = new Map();
+
+function commandExists(name) {
+  // PATH does not change during a run, so each lookup happens once
+  if (commandCache.has(name)) return commandCache.get(name);
+  
+  // Scan PATH in-process rather than spawning `which`
+  const found = (process.env.PATH || '').split(path.delimiter).some((dir) => {
+    if (!dir) return false;
+    try {
+      fs.accessSync(path.join(dir, name), fs.constants.X_OK);
+      return true;
+    } catch {
+      return false;
+    }
+  });
+  commandCache.set(name, found);
+  return found;
+}
+
+let cachedUser = null;
+
+function probeSudo() {
+  if (!commandExists('sudo')) return false;
+  try {
+    execFileSync('sudo', ['-n', 'true'], { stdio: 'ignore' });
+    return true;
+  } catch {
+    return false;
+  }
+}
+
 function getCurrentUser() {
+  // The user cannot change within one run, so probe sudo only once
+  if (cachedUser) return cachedUser;
+  
   try {
-    const username = execSync('whoami', { encoding: 'utf-8' }).trim();
+    const { username } = os.userInfo();
     const isRoot = username === 'root';
+    let hasSudo;
     
-    let hasSudo = false;
-    try {
-      execSync('sudo -n true', { stdio: 'ignore' });
-      hasSudo = true;
-    } catch {}
-    
-    return {
+    cachedUser = {
       username,
       isRoot,
-      hasSudo,
       isBayanatUser: username === 'bayanat',
-      isAdminUser: ['ubuntu', 'root'].includes(username) || hasSudo
+      // Spawning sudo is deferred until a check actually needs it
+      get hasSudo() {
+        if (hasSudo === undefined) hasSudo = probeSudo();
+        return hasSudo;
+      },
+      get isAdminUser() {
+        return ['ubuntu', 'root'].includes(username) || this.hasSudo;
+      }
     };
+    return cachedUser;
   } catch (error) {
     console.error('Error getting user info:', error.message);
     process.exit(1);
   }
 }
 
-function runCommand(command, options = {}) {
+function runCommand(file, args = [], options = {}) {
+  const { silent, discardOutput, ...execOptions } = options;
+  
+  // stdout nobody reads goes straight to /dev/null: no pipe to drain, nothing to decode.
+  // stderr stays piped so failures still carry the error text.
+  let stdio = silent ? 'pipe' : 'inherit';
+  if (discardOutput) stdio = ['pipe', 'ignore', 'pipe'];
+  
+  // Arguments are passed straight to the program: no shell, no quoting issues with paths
   try {
-    const result = execSync(command, { 
+    const result = execFileSync(file, args, { 
       encoding: 'utf-8', 
-      stdio: options.silent ? 'pipe' : 'inherit',
-      ...options 
+      stdio,
+      ...execOptions 
     });
     return result;
   } catch (error) {
-    console.error(`Error running command: ${command}`);
+    console.error(`Error running command: ${[file, ...args].join(' ')}`);
     console.error(error.message);
     process.exit(1);
   }
 }
 
+function runCommandAsync(file, args = [], options = {}) {
+  // Non-blocking variant for independent commands; rejects instead of exiting
+  return new Promise((resolve, reject) => {
+    execFile(file, args, { encoding: 'utf-8', ...options }, (error, stdout) => {
+      if (error) reject(error);
+      else resolve(stdout);
+    });
+  });
+}
+
+function checkNetworkConnectivity(url) {
+  // Loaded here so commands that never touch the network don't pay for it
+  const net = require('net');
+  
+  return new Promise((resolve) => {
+    // A plain TCP connect proves reachability in one round trip, no TLS or HTTP needed
+    const { hostname } = new URL(url);
+    const socket = net.createConnection({ host: hostname, port: 443, timeout: 5000 });
+    socket.once('connect', () => {
+      socket.destroy();
+      resolve(true);
+    });
+    socket.once('timeout', () => {
+      socket.destroy();
+      resolve(false);
+    });
+    socket.once('error', () => resolve(false));
+  });
+}
+
+function cloneRepository(targetDir, depth = 1) {
+  // History is not needed to run Bayanat, so clone only the latest commit by default
+  const depthArgs = depth ? [`--depth=${depth}`, '--single-branch'] : [];
+  runCommand('git', ['clone', ...depthArgs, BAYANAT_REPO_URL, targetDir]);
+}
+
+function validateBayanatDirectory(appDir, requiredPaths = REQUIRED_PATHS) {
+  // A single directory read yields every entry's name and type
+  const entries = new Map(
+    fs.readdirSync(appDir, { withFileTypes: true }).map((entry) => [entry.name, entry])
+  );
+  
+  for (const [name, isDirectory] of requiredPaths) {
+    let entry = entries.get(name);
+    // Symlinks report their own type, so only those need a stat of the target
+    if (entry && entry.isSymbolicLink()) {
+      entry = fs.statSync(path.join(appDir, name), { throwIfNoEntry: false });
+    }
+    if (!entry || entry.isDirectory() !== isDirectory) {
+      console.error(`❌ '${appDir}' is not a Bayanat installation (missing ${name})`);
+      return false;
+    }
+  }
+  return true;
+}
+
+function isDirectoryEmpty(dir) {
+  // Read a single entry instead of listing the whole directory
+  const handle = fs.opendirSync(dir);
+  try {
+    return handle.readSync() === null;
+  } finally {
+    handle.closeSync();
+  }
+}
+
+function isRemoteAhead(appDir) {
+  const [localHead, upstream] = runCommand('git', ['rev-parse', 'HEAD', '--abbrev-ref', '@{u}'], { cwd: appDir, silent: true })
+    .trim()
+    .split('\n');
+  const separator = upstream.indexOf('/');
+  const remote = upstream.slice(0, separator);
+  const branch = upstream.slice(separator + 1);
+  
+  // ls-remote asks the server for a single ref; no objects are transferred
+  const [remoteHead] = runCommand('git', ['ls-remote', remote, `refs/heads/${branch}`], { cwd: appDir, silent: true })
+    .split('\t');
+  return remoteHead !== localHead;
+}
+
+const versionCache = new Map();
+
+function getBayanatVersion(appDir) {
+  const pyprojectPath = path.join(appDir, 'pyproject.toml');
+  const stats = fs.statSync(pyprojectPath, { throwIfNoEntry: false });
+  if (!stats) return null;
+  
+  // Keyed on mtime so a merge that rewrites pyproject.toml invalidates the entry
+  const cached = versionCache.get(pyprojectPath);
+  if (cached && cached.mtimeMs === stats.mtimeMs) return cached.version;
+  
+  const match = fs.readFileSync(pyprojectPath, 'utf-8').match(PROJECT_VERSION_RE);
+  const version = match ? match[1] : null;
+  versionCache.set(pyprojectPath, { mtimeMs: stats.mtimeMs, version });
+  return version;
+}
+
+function venvBin(appDir, name = '') {
+  // Without a name this is the venv's bin directory itself
+  return path.join(appDir, 'env', 'bin', name);
+}
+
+function createVirtualEnv(appDir) {
+  const envDir = path.join(appDir, 'env');
+  // uv builds the venv in a fraction of the time; --seed keeps pip available
+  if (commandExists('uv')) {
+    runCommand('uv', ['venv', '--seed', '--python', 'python3', envDir]);
+  } else {
+    runCommand('python3', ['-m', 'venv', envDir]);
+  }
+}
+
+function installRequirements(appDir, extraArgs = []) {
+  const requirementsPath = path.join(appDir, 'requirements', 'main.txt');
+  // Single run so the resolver starts only once; uv when available, pip otherwise
+  if (commandExists('uv')) {
+    runCommand('uv', ['pip', 'install', '--python', venvBin(appDir, 'python'), ...extraArgs, '-r', requirementsPath]);
+  } else {
+    runCommand(venvBin(appDir, 'pip'), ['install', '--disable-pip-version-check', '--no-input', '--prefer-binary', ...extraArgs, '-r', requirementsPath]);
+  }
+}
+
+function getRequirementsHashes(appDir) {
+  // Loaded here so commands that never install dependencies don't pay for it
+  const crypto = require('crypto');
+  
+  // Hash of the requirements file and the hash recorded by the last successful install
+  const requirements = fs.readFileSync(path.join(appDir, 'requirements', 'main.txt'));
+  const stampPath = path.join(appDir, 'env', REQUIREMENTS_STAMP);
+  return {
+    current: crypto.createHash('sha256').update(requirements).digest('hex'),
+    installed: fs.existsSync(stampPath) ? fs.readFileSync(stampPath, 'utf-8').trim() : null
+  };
+}
+
 function checkUserPermissions(command) {
   const user = getCurrentUser();
   
   // App installation can be run by bayanat user in their directory
-  if (command === 'install' && !user.isAdminUser && !user.isBayanatUser) {
+  if (command === 'install' && !user.isBayanatUser && !user.isAdminUser) {
     console.error('❌ Application installation requires admin or bayanat user privileges');
     console.error('Please run as root, admin user, or switch to bayanat user: sudo su - bayanat');
     return false;
@@ -67,37 +276,73 @@ function checkUserPermissions(command) {
   return true;
 }
 
-function restartServices(serviceName = 'bayanat') {
-  console.log('🔄 Restarting services...');
-  const user = getCurrentUser();
+async function getRestartCount(serviceName) {
+  const output = await runCommandAsync('systemctl', ['show', '-p', 'NRestarts', '--value', serviceName]);
+  return output.trim();
+}
+
+async function waitForService(serviceName, timeoutMs = 10000, settleMs = 2000) {
+  // Type=simple units report active the moment they start, so the service
+  // must also stay active without restarting for settleMs to count as up
+  const deadline = Date.now() + timeoutMs;
+  let activeSince = null;
+  let restarts = null;
   
-  try {
-    // Restart main service
-    const cmd = user.isBayanatUser ? 
-      `sudo systemctl restart ${serviceName}` : 
-      `systemctl restart ${serviceName}`;
-    
-    runCommand(cmd, { silent: true });
-    console.log(`✅ Successfully restarted ${serviceName} service`);
-    
-    // Restart celery service if exists
-    const celeryService = `${serviceName}-celery`;
-    const celeryCmd = user.isBayanatUser ? 
-      `sudo systemctl restart ${celeryService}` : 
-      `systemctl restart ${celeryService}`;
-    
+  while (Date.now() < deadline) {
     try {
-      runCommand(celeryCmd, { silent: true });
-      console.log(`✅ Successfully restarted ${celeryService} service`);
+      await runCommandAsync('systemctl', ['is-active', '--quiet', serviceName]);
+      if (activeSince === null) {
+        activeSince = Date.now();
+        restarts = await getRestartCount(serviceName);
+      } else if (Date.now() - activeSince >= settleMs) {
+        if ((await getRestartCount(serviceName)) === restarts) return true;
+        activeSince = null;
+      }
     } catch {
-      console.log(`⚠️  ${celeryService} service not found or failed to restart`);
+      activeSince = null;
     }
-    
-    return true;
-  } catch (error) {
-    console.error('❌ Failed to restart services:', error.message);
+    await new Promise((resolve) => setTimeout(resolve, 250));
+  }
+  return false;
+}
+
+async function restartServices(serviceName = 'bayanat') {
+  console.log('🔄 Restarting services...');
+  if (!commandExists('systemctl')) {
+    console.error('❌ systemctl not found - services must be restarted manually');
+    return false;
+  }
+  
+  const user = getCurrentUser();
+  const restartCommand = (service) => user.isBayanatUser ? 
+    ['sudo', ['systemctl', 'restart', service]] : 
+    ['systemctl', ['restart', service]];
+  
+  const restart = (service) => runCommandAsync(...restartCommand(service));
+  const settle = (promise) => Promise.allSettled([promise]).then(([result]) => result);
+  
+  // Restart celery service if exists
+  const celeryService = `${serviceName}-celery`;
+  
+  // The services are independent, so restart them concurrently - unless sudo
+  // is involved, where two password prompts on one tty would fight over input
+  const [main, celery] = user.isBayanatUser ? 
+    [await settle(restart(serviceName)), await settle(restart(celeryService))] : 
+    await Promise.allSettled([restart(serviceName), restart(celeryService)]);
+  
+  if (main.status === 'rejected') {
+    console.error('❌ Failed to restart services:', main.reason.message);
     return false;
   }
+  console.log(`✅ Successfully restarted ${serviceName} service`);
+  
+  if (celery.status === 'fulfilled') {
+    console.log(`✅ Successfully restarted ${celeryService} service`);
+  } else {
+    console.log(`⚠️  ${celeryService} service not found or failed to restart`);
+  }
+  
+  return true;
 }
 
 function createEnvironmentConfig(appDir) {
@@ -111,18 +356,11 @@ function createEnvironmentConfig(appDir) {
 
     // Use Bayanat's gen-env.sh script for proper secrets
     try {
-      runCommand('./gen-env.sh -n -o', { cwd: appDir, silent: true });
+      runCommand('./gen-env.sh', ['-n', '-o'], { cwd: appDir, discardOutput: true });
       console.log('✅ Environment generated with proper secrets');
       
       // Append database and Redis configuration
-      const dbConfig = `
-# Database (convention-based)
-DATABASE_URL=postgresql://bayanat@localhost/bayanat
-
-# Redis
-REDIS_URL=redis://localhost:6379/0
-`;
-      fs.appendFileSync(envPath, dbConfig);
+      fs.appendFileSync(envPath, `\n${CONNECTION_CONFIG}`);
       console.log('✅ Database configuration added');
       
     } catch {
@@ -132,12 +370,7 @@ REDIS_URL=redis://localhost:6379/0
       const envContent = `FLASK_APP=run.py
 FLASK_DEBUG=0
 
-# Database (convention-based)
-DATABASE_URL=postgresql://bayanat@localhost/bayanat
-
-# Redis
-REDIS_URL=redis://localhost:6379/0
-
+${CONNECTION_CONFIG}
 # Security (generate your own keys for production)
 SECRET_KEY=change-this-in-production
 SECURITY_PASSWORD_SALT=change-this-in-production
@@ -150,14 +383,14 @@ SECURITY_TWO_FACTOR=True
     }
     
     // Set proper permissions
-    runCommand(`chmod 640 ${envPath}`);
+    fs.chmodSync(envPath, 0o640);
     
   } catch (error) {
     console.log('⚠️  Could not create environment file:', error.message);
   }
 }
 
-function setupSystemdServices(appDir) {
+async function setupSystemdServices(appDir) {
   try {
     // Create main service file
     const mainService = `[Unit]
@@ -169,7 +402,7 @@ User=bayanat
 Group=bayanat
 WorkingDirectory=${appDir}
 EnvironmentFile=${appDir}/.env
-ExecStart=${appDir}/env/bin/uwsgi --ini uwsgi.ini
+ExecStart=${venvBin(appDir, 'uwsgi')} --ini uwsgi.ini
 Restart=always
 RestartSec=3
 StartLimitIntervalSec=0
@@ -194,9 +427,9 @@ After=network.target redis.service
 User=bayanat
 Group=bayanat
 WorkingDirectory=${appDir}
-Environment="PATH=${appDir}/env/bin:/usr/bin"
+Environment="PATH=${venvBin(appDir)}:/usr/bin"
 EnvironmentFile=${appDir}/.env
-ExecStart=${appDir}/env/bin/celery -A enferno.tasks worker --autoscale 2,5 -B
+ExecStart=${venvBin(appDir, 'celery')} -A enferno.tasks worker --autoscale 2,5 -B
 Restart=always
 RestartSec=3
 
@@ -205,25 +438,25 @@ WantedBy=multi-user.target
 `;
 
     // Write service files (requires admin privileges)
-    runCommand(`echo '${mainService}' | sudo tee /etc/systemd/system/bayanat.service > /dev/null`);
-    runCommand(`echo '${celeryService}' | sudo tee /etc/systemd/system/bayanat-celery.service > /dev/null`);
+    runCommand('sudo', ['tee', '/etc/systemd/system/bayanat.service'], { input: mainService, discardOutput: true });
+    runCommand('sudo', ['tee', '/etc/systemd/system/bayanat-celery.service'], { input: celeryService, discardOutput: true });
     
     // Enable and start services
-    runCommand('sudo systemctl daemon-reload');
-    runCommand('sudo systemctl enable bayanat bayanat-celery');
-    runCommand('sudo systemctl start bayanat bayanat-celery');
+    runCommand('sudo', ['systemctl', 'daemon-reload']);
+    runCommand('sudo', ['systemctl', 'enable', 'bayanat', 'bayanat-celery']);
+    runCommand('sudo', ['systemctl', 'start', 'bayanat', 'bayanat-celery']);
     
     console.log('✅ Systemd services created and started');
     
-    // Show status
-    setTimeout(() => {
-      try {
-        console.log('\n📊 Service Status:');
-        runCommand('sudo systemctl status bayanat --no-pager -l', { silent: false });
-      } catch (error) {
-        console.log('⚠️  Check service status with: systemctl status bayanat');
-      }
-    }, 2000);
+    // Show status as soon as the service is up instead of after a fixed delay
+    console.log('⏳ Waiting for bayanat service to start...');
+    try {
+      if (!(await waitForService('bayanat'))) throw new Error('service did not settle');
+      console.log('\n📊 Service Status:');
+      console.log(await runCommandAsync('sudo', ['systemctl', 'status', 'bayanat', '--no-pager', '-l']));
+    } catch (error) {
+      console.log('⚠️  Check service status with: systemctl status bayanat');
+    }
     
   } catch (error) {
     console.log('⚠️  Could not auto-setup services (requires admin privileges)');
@@ -265,7 +498,7 @@ function showRoleBasedHelp() {
 program
   .name('bayanat')
   .description('CLI tool for Bayanat data management system')
-  .version('0.1.0')
+  .version(CLI_VERSION)
   .action(() => {
     showRoleBasedHelp();
     console.log('\nUse bayanat --help to see all available commands.');
@@ -276,32 +509,53 @@ program
   .description('Install the Bayanat application in the current directory')
   .option('--force', 'Force installation even if directory is not empty')
   .option('--skip-system', 'Skip system dependencies installation')
-  .action((options) => {
+  .option('--upgrade-pip', 'Upgrade pip in the new environment before installing dependencies')
+  .option('--full-history', 'Clone the full Git history instead of only the latest commit')
+  .action(async (options) => {
+    // Start the network probe first so it overlaps with the local checks below.
+    // A direct connect proves nothing when traffic goes through a proxy, so skip it then.
+    const usesProxy = ['https_proxy', 'HTTPS_PROXY', 'all_proxy', 'ALL_PROXY'].some((name) => process.env[name]);
+    const networkCheck = usesProxy ? Promise.resolve(true) : checkNetworkConnectivity(BAYANAT_REPO_URL);
+    
     if (!checkUserPermissions('install')) process.exit(1);
     
+    // All local checks run while the network probe is in flight
+    for (const [command, name] of [['git', 'Git'], ['python3', 'Python 3']]) {
+      if (!commandExists(command)) {
+        console.error(`❌ ${name} is not installed. Please install ${name} and try again.`);
+        process.exit(1);
+      }
+    }
+    
     const appDir = process.cwd();
     console.log(`🚀 Installing Bayanat in: ${appDir}`);
     
     try {
       // Check if directory is empty
-      if (!options.force && fs.readdirSync(appDir).length > 0) {
+      if (!options.force && !isDirectoryEmpty(appDir)) {
         console.error(`❌ Directory '${appDir}' is not empty. Use --force to override.`);
         process.exit(1);
       }
       
+      // Only a hint: git may still get through a proxy configured in git itself,
+      // and git clone reports the real error if it cannot
+      console.log('🌐 Checking network connectivity...');
+      if (!(await networkCheck)) {
+        console.log('⚠️  Could not reach GitHub directly - continuing, git clone will report any network error');
+      }
+      
       // Clone repository directly to current directory
       console.log('📦 Cloning Bayanat repository...');
-      runCommand(`git clone ${BAYANAT_REPO_URL} .`);
+      cloneRepository('.', options.fullHistory ? 0 : 1);
       
       // Create virtual environment
       console.log('🐍 Setting up Python environment...');
-      runCommand(`python3 -m venv ${path.join(appDir, 'env')}`);
+      createVirtualEnv(appDir);
       
       // Install dependencies
       console.log('📚 Installing dependencies...');
-      const pipPath = path.join(appDir, 'env', 'bin', 'pip');
-      runCommand(`${pipPath} install --upgrade pip`);
-      runCommand(`${pipPath} install -r ${path.join(appDir, 'requirements', 'main.txt')}`);
+      installRequirements(appDir, options.upgradePip ? ['--upgrade', 'pip'] : []);
+      fs.writeFileSync(path.join(appDir, 'env', REQUIREMENTS_STAMP), getRequirementsHashes(appDir).current);
       
       // Create environment configuration
       console.log('📝 Creating environment configuration...');
@@ -309,16 +563,16 @@ program
       
       // Create CLI metadata with conventions
       const metadata = {
-        version: '0.1.0',
+        version: CLI_VERSION,
         installed_at: new Date().toISOString(),
         installation_type: 'production',
-        database_url: 'postgresql://bayanat@localhost/bayanat'
+        database_url: DATABASE_URL
       };
       fs.writeFileSync(path.join(appDir, '.bayanat-cli'), JSON.stringify(metadata, null, 2));
       
       // Auto-setup systemd services
       console.log('⚙️  Setting up systemd services...');
-      setupSystemdServices(appDir);
+      await setupSystemdServices(appDir);
       
       console.log('🎉 Bayanat installation completed successfully!');
       console.log('✅ Services are running and ready to use!');
@@ -337,28 +591,65 @@ program
   .option('--skip-deps', 'Skip dependency installation')
   .option('--skip-restart', 'Skip service restart')
   .option('--force', 'Force update even if already up-to-date')
-  .action((options) => {
+  .action(async (options) => {
     if (!checkUserPermissions('update')) process.exit(1);
     
     const appDir = process.cwd();
+    const requiredPaths = options.skipDeps ? REQUIRED_PATHS : [...REQUIRED_PATHS, ...DEPENDENCY_PATHS];
+    if (!validateBayanatDirectory(appDir, requiredPaths)) process.exit(1);
+    const previousVersion = getBayanatVersion(appDir);
     
     try {
       console.log('🔄 Updating Bayanat...');
       
+      // Restart only when a step changed something; with both steps skipped there is nothing to compare
+      let changed = options.force || (options.skipGit && options.skipDeps);
+      
       if (!options.skipGit) {
-        console.log('📦 Fetching latest code...');
-        runCommand('git fetch', { cwd: appDir });
-        runCommand('git pull', { cwd: appDir });
+        if (!commandExists('git')) {
+          console.error('❌ Git is not installed. Please install Git or use --skip-git.');
+          process.exit(1);
+        }
+        
+        // Nothing new upstream: skip the fetch, but still let the dependency
+        // stamp catch up after a previous run that failed mid-install
+        if (!options.force && !isRemoteAhead(appDir)) {
+          console.log('✅ Code is already up to date');
+        } else {
+          console.log('📦 Fetching latest code...');
+          // pull would fetch a second time, so merge the upstream we just fetched
+          // No remote argument: fetch whatever remote the branch's upstream (@{u}) lives on
+          runCommand('git', ['fetch', '--no-tags', '--prune'], { cwd: appDir });
+          runCommand('git', ['merge', '--ff-only', '@{u}'], { cwd: appDir });
+          changed = true;
+        }
       }
       
       if (!options.skipDeps) {
-        console.log('📚 Installing dependencies...');
-        const pipPath = path.join(appDir, 'env', 'bin', 'pip');
-        runCommand(`${pipPath} install -r ${path.join(appDir, 'requirements', 'main.txt')}`);
+        // Unchanged requirements since the last install: pip would only re-resolve
+        const hashes = getRequirementsHashes(appDir);
+        if (hashes.current === hashes.installed && !options.force) {
+          console.log('✅ Dependencies unchanged, skipping installation');
+        } else {
+          console.log('📚 Installing dependencies...');
+          installRequirements(appDir);
+          fs.writeFileSync(path.join(appDir, 'env', REQUIREMENTS_STAMP), hashes.current);
+          changed = true;
+        }
+      }
+      
+      if (!changed) {
+        console.log('✅ Bayanat is already up to date. Use --force to update anyway.');
+        return;
       }
       
       if (!options.skipRestart) {
-        restartServices();
+        if (!(await restartServices())) process.exit(1);
+      }
+      
+      const currentVersion = getBayanatVersion(appDir);
+      if (currentVersion && currentVersion !== previousVersion) {
+        console.log(`📦 Bayanat updated from ${previousVersion || 'unknown'} to ${currentVersion}`);
       }
       
       console.log('🎉 Update completed successfully!');
@@ -374,15 +665,15 @@ program
   .command('restart')
   .description('Restart Bayanat services')
   .option('--service <name>', 'Service name to restart', 'bayanat')
-  .action((options) => {
+  .action(async (options) => {
     const user = getCurrentUser();
     
-    if (!user.isAdminUser && !user.isBayanatUser) {
+    if (!user.isBayanatUser && !user.isAdminUser) {
       console.error('❌ Service restart requires appropriate privileges');
       process.exit(1);
     }
     
-    if (restartServices(options.service)) {
+    if (await restartServices(options.service)) {
       console.log('🎉 Services restarted successfully!');
     } else {
       process.exit(1);
@@ -403,14 +694,12 @@ program
   .command('version')
   .description('Display version information')
   .action(() => {
-    console.log('Bayanat CLI version: 0.1.0');
-    // This would check the actual Bayanat version from pyproject.toml
+    console.log(`Bayanat CLI version: ${CLI_VERSION}`);
+    
+    const bayanatVersion = getBayanatVersion(process.cwd());
+    if (bayanatVersion) {
+      console.log(`Bayanat version: ${bayanatVersion}`);
+    }
   });
 
-// Handle case when no command is provided
-if (process.argv.length === 2) {
-  showRoleBasedHelp();
-  console.log('\nUse bayanat --help to see all available commands.');
-}
-
-program.parse();
\ No newline at end of file
+program.parseAsync();
\ No newline at end of file
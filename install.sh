@@ -5,11 +5,18 @@ log() { echo "[$(date '+%H:%M:%S')] $1"; }
 error() { echo "[ERROR] $1" >&2; exit 1; }
 
 # Get domain
-DOMAIN="${DOMAIN:-${1:-$(curl -s https://ipinfo.io/ip 2>/dev/null || echo 127.0.0.1)}}"
+DOMAIN="${DOMAIN:-${1:-$(curl -s --connect-timeout 3 --max-time 5 https://ipinfo.io/ip 2>/dev/null || echo 127.0.0.1)}}"
 log "Installing Bayanat for: $DOMAIN"
 
 [ "$EUID" -eq 0 ] || error "Must run as root"
 
+# uv needs nothing from apt, so download it while packages install
+if command -v curl &>/dev/null; then
+    UV_LOG=$(mktemp)
+    { set -o pipefail; curl -LsSf https://astral.sh/uv/install.sh | sh; } > "$UV_LOG" 2>&1 &
+    UV_PID=$!
+fi
+
 # Install packages
 log "Installing packages..."
 export DEBIAN_FRONTEND=noninteractive
@@ -22,7 +29,12 @@ apt-get install -y -qq \
 
 # Install uv globally
 log "Installing uv..."
-curl -LsSf https://astral.sh/uv/install.sh | sh
+if [ -n "$UV_PID" ]; then
+    wait "$UV_PID" || { cat "$UV_LOG"; error "uv install failed"; }
+    rm -f "$UV_LOG"
+else
+    curl -LsSf https://astral.sh/uv/install.sh | sh
+fi
 cp ~/.cargo/bin/uv /usr/local/bin/ 2>/dev/null || cp ~/.local/bin/uv /usr/local/bin/
 chmod 755 /usr/local/bin/uv
 
@@ -52,7 +64,7 @@ grep -q "local.*bayanat.*trust" "$PG_CONFIG" 2>/dev/null || {
 log "Setting up application..."
 [ -f /opt/bayanat/run.py ] || {
     rm -rf /opt/bayanat
-    git clone https://github.com/sjacorg/bayanat.git /opt/bayanat
+    git clone --depth=1 https://github.com/sjacorg/bayanat.git /opt/bayanat
 }
 chown -R bayanat:bayanat /opt/bayanat
 
@@ -66,9 +78,10 @@ uv sync --frozen
     ./gen-env.sh -n -o
 }
 
+# Environment is synced above; call flask directly instead of re-syncing via uv run
 export FLASK_APP=run.py
-uv run flask create-db --create-exts
-uv run flask import-data
+.venv/bin/flask create-db --create-exts
+.venv/bin/flask import-data
 SETUP
 
 # Create configs
@@ -118,7 +131,7 @@ mkdir -p /var/log/caddy && chown caddy:caddy /var/log/caddy
 
 # Setup daemon permissions (CRITICAL SECURITY FEATURE)
 cat > /etc/sudoers.d/bayanat-daemon << 'EOF'
-bayanat-daemon ALL=(ALL) NOPASSWD: /bin/systemctl restart bayanat, /bin/systemctl restart caddy, /bin/systemctl is-active bayanat, /bin/systemctl is-active caddy
+bayanat-daemon ALL=(ALL) NOPASSWD: /bin/systemctl restart bayanat, /bin/systemctl restart caddy
 bayanat-daemon ALL=(bayanat) NOPASSWD: /usr/bin/git -C /opt/bayanat pull
 EOF
 
@@ -141,22 +154,25 @@ respond() { printf "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent
 case "$path" in
     "/update-bayanat")
         log "Starting update" && cd /opt/bayanat
-        git_output=$(sudo -u bayanat git pull 2>&1)
-        echo "$git_output" | grep -q "Already up to date" && { respond '{"success":true,"message":"Already up to date"}'; exit; }
-        sudo -u bayanat bash -c "cd /opt/bayanat && PATH=/usr/local/bin:\$PATH uv sync --frozen"
-        sudo -u bayanat bash -c "cd /opt/bayanat && PATH=/usr/local/bin:\$PATH FLASK_APP=run.py uv run flask apply-migrations"
+        # Stream command output to the log; stdout is the client socket
+        before=$(git rev-parse HEAD)
+        sudo -u bayanat git pull >> "$LOG_FILE" 2>&1 || { respond '{"success":false,"error":"git pull failed"}'; exit; }
+        [ "$(git rev-parse HEAD)" = "$before" ] && { respond '{"success":true,"message":"Already up to date"}'; exit; }
+        sudo -u bayanat bash -c "cd /opt/bayanat && export PATH=/usr/local/bin:\$PATH FLASK_APP=run.py && uv sync --frozen && .venv/bin/flask apply-migrations" >> "$LOG_FILE" 2>&1 || { respond '{"success":false,"error":"dependency sync or migration failed"}'; exit; }
         sudo systemctl restart bayanat
         respond '{"success":true,"message":"Updated successfully"}'
         ;;
     "/restart-service")
-        service=$(echo "$body" | sed -n 's/.*"service":"\([^"]*\)".*/\1/p')
+        service_re='"service":"([^"]*)"'
+        [[ "$body" =~ $service_re ]] && service="${BASH_REMATCH[1]}"
         [[ "$service" =~ ^(bayanat|caddy)$ ]] && {
             sudo systemctl restart "$service"
             respond "{\"success\":true,\"message\":\"$service restarted\"}"
         } || respond '{"success":false,"error":"Invalid service"}'
         ;;
     "/health")
-        sudo systemctl is-active bayanat >/dev/null 2>&1 &&
+        # Reading unit state needs no privileges, so skip the sudo round trip
+        systemctl is-active --quiet bayanat &&
             respond '{"success":true,"status":"healthy"}' ||
             respond '{"success":false,"status":"unhealthy"}'
         ;;
@@ -197,7 +213,12 @@ systemctl daemon-reload
 systemctl enable --now bayanat bayanat-api.socket
 systemctl enable caddy
 systemctl restart caddy  # Restart to trigger certificate acquisition
-sleep 5
+
+# Poll until services are up (at most 5s) rather than always sleeping
+for _ in {1..10}; do
+    systemctl is-active --quiet bayanat && systemctl is-active --quiet caddy && break
+    sleep 0.5
+done
 
 # Status
 echo ""